@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Import-time benchmark for the chat CLIs, to guard cold start against regressions.
+
+Each module is imported in a fresh interpreter several times and the median wall
+time of the whole process (interpreter start + import) is reported next to the
+bare interpreter baseline and the deferred heavy imports.
+The run fails (exit code 1) if a CLI module eagerly imports google.adk/google.genai
+or takes longer than --max-ms to import.
+
+For the full startup breakdown of a live session, run a CLI with STARTUP_REPORT=1.
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import time
+from statistics import median
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+CLI_MODULES = ["session_example", "agent_runner"]
+HEAVY_MODULES = ["google.adk", "google.genai"]
+
+MEASURE = """
+import sys
+{statement}
+print(",".join(m for m in {heavy!r} if m in sys.modules))
+"""
+
+def measure(statement, runs):
+    """Median process wall time in ms and the heavy modules pulled in, or (None, error)."""
+    timings = []
+    heavy = ""
+    code = MEASURE.format(statement=statement, heavy=HEAVY_MODULES)
+    for _ in range(runs):
+        start = time.perf_counter()
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            cwd=HERE, capture_output=True, text=True,
+        )
+        timings.append((time.perf_counter() - start) * 1000)
+        if result.returncode != 0:
+            return None, (result.stderr.strip().splitlines() or ["unknown error"])[-1]
+        heavy = result.stdout.strip()
+    return median(timings), heavy
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5, help="fresh interpreters per measurement")
+    parser.add_argument("--max-ms", type=float, default=500.0, help="fail if importing a CLI module takes longer than this")
+    args = parser.parse_args()
+
+    failures = []
+    print(f"{'import':<24} {'median ms':>10}")
+    baseline, _ = measure("pass", args.runs)
+    print(f"{'(interpreter baseline)':<24} {baseline:>10.1f}")
+
+    for module in HEAVY_MODULES:
+        ms, _ = measure(f"import {module}", args.runs)
+        print(f"{module:<24} {ms:>10.1f}  (deferred)" if ms is not None else f"{module:<24} {'n/a':>10}  (not installed)")
+
+    for module in CLI_MODULES:
+        ms, heavy = measure(f"import {module}", args.runs)
+        if ms is None:
+            print(f"{module:<24} {'error':>10}  {heavy}")
+            failures.append(f"{module} failed to import: {heavy}")
+            continue
+        print(f"{module:<24} {ms:>10.1f}")
+        if heavy:
+            failures.append(f"{module} eagerly imports {heavy}")
+        if ms > args.max_ms:
+            failures.append(f"{module} took {ms:.1f} ms to import (limit {args.max_ms:.0f} ms)")
+
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    sys.exit(1 if failures else 0)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""
+Benchmark the time-range memory path against the full memory dump on the
+LoCoMo temporal questions (category 2 in locomo10.json).
+
+Each conversation is imported into chat_history under its own user id with the
+original session_N_date_time stamps. For every temporal question both paths
+build a memory context, and we report retrieval latency, context size and
+evidence recall (how many evidence turns made it into the context), for all
+temporal questions and for the subset that names a time window (the others
+take the full-dump path either way).
+Pass --answer to also ask Gemini each question and score the replies.
+Pass --offline to select the rows in memory instead of from Postgres; latency
+then covers only the in-process filtering, not the database query.
+"""
+
+import argparse
+import json
+import os
+import re
+import time
+from statistics import mean, median
+
+from time_range import (
+    TIME_RANGE_PADDING,
+    describe_time_range,
+    locomo_timeline,
+    parse_session_date_time,
+    parse_time_range,
+)
+
+LOCOMO_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "locomo10.json")
+TEMPORAL_CATEGORY = 2
+
+def last_session_time(conversation):
+    """Questions are asked 'now', i.e. right after the last session."""
+    times = [
+        parse_session_date_time(value)
+        for key, value in conversation.items()
+        if key.endswith("_date_time") and value
+    ]
+    return max(times)
+
+def evidence_texts(conversation):
+    """Map dia_id -> turn text for a conversation."""
+    texts = {}
+    for key, turns in conversation.items():
+        if re.fullmatch(r"session_\d+", key):
+            for turn in turns:
+                texts[turn["dia_id"]] = turn["text"]
+    return texts
+
+def evidence_recall(memory_text, evidence, texts):
+    found = [texts[d] in memory_text for d in evidence if d in texts]
+    return sum(found) / len(found) if found else 1.0
+
+def normalize(text):
+    return re.sub(r"[^a-z0-9 ]", " ", str(text).lower()).split()
+
+def answer_matches(reply, answer):
+    """Lenient match: every token of the gold answer appears in the reply."""
+    reply_tokens = set(normalize(reply))
+    return all(token in reply_tokens for token in normalize(answer))
+
+def ask_model(client, memory_text, question):
+    prompt_text = (
+        f"Memory:\n{memory_text}\n"
+        f"User: {question}\n"
+        "Agent:"
+    )
+    response = client.models.generate_content(model="gemini-2.0-flash", contents=prompt_text)
+    return response.text or ""
+
+def timed(fn, *args, **kwargs):
+    start = time.perf_counter()
+    result = fn(*args, **kwargs)
+    return result, (time.perf_counter() - start) * 1000
+
+# -----------------------------
+# In-memory paths (--offline)
+# -----------------------------
+
+def render_rows(rows):
+    return "\n".join(f"[{created_at:%Y-%m-%d}] {speaker}: {text}" for _, speaker, text, created_at in rows)
+
+def offline_full_dump(rows):
+    return render_rows(rows)
+
+def offline_memory_context(rows, question, now):
+    """Mirrors session_example.build_memory_context over an in-memory timeline."""
+    time_range = parse_time_range(question, now)
+    if time_range:
+        start, end = time_range
+        window = [row for row in rows if start <= row[3] < end]
+        if window:
+            label = describe_time_range(start, end)
+            return f"Messages dated {label} (plus the following {TIME_RANGE_PADDING.days} days):\n{render_rows(window)}"
+    return render_rows(rows)
+
+# -----------------------------
+# Reporting
+# -----------------------------
+
+def summarize(name, rows):
+    if not rows:
+        print(f"  {name:<12} n=0")
+        return
+    latencies = [r["ms"] for r in rows]
+    print(f"  {name:<12} n={len(rows):<4} "
+          f"latency ms median={median(latencies):7.2f} mean={mean(latencies):7.2f}  "
+          f"context chars mean={mean(r['chars'] for r in rows):9.0f}  "
+          f"evidence recall={mean(r['recall'] for r in rows):.3f}", end="")
+    answered = [r["correct"] for r in rows if "correct" in r]
+    if answered:
+        print(f"  accuracy={mean(answered):.3f}", end="")
+    print()
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--samples", type=int, default=10, help="number of LoCoMo conversations to use")
+    parser.add_argument("--answer", action="store_true", help="also ask Gemini and score the answers")
+    parser.add_argument("--offline", action="store_true", help="select rows in memory instead of from Postgres")
+    args = parser.parse_args()
+
+    client = None
+    if args.answer:
+        from dotenv import load_dotenv
+        load_dotenv()
+        if not os.getenv("GOOGLE_API_KEY"):
+            print("Error: Missing GOOGLE_API_KEY")
+            return
+        from google.genai import Client
+        client = Client(api_key=os.getenv("GOOGLE_API_KEY"))
+
+    if not args.offline:
+        from session_example import (
+            build_memory_context,
+            import_locomo_sample,
+            init_memory_table,
+            load_user_memory,
+        )
+        init_memory_table()
+
+    with open(LOCOMO_PATH) as f:
+        samples = json.load(f)[:args.samples]
+
+    results = {"full_dump": [], "time_range": []}
+    windowed = []
+
+    for sample in samples:
+        user_id = f"locomo_{sample['sample_id']}"
+        conversation = sample["conversation"]
+        now = last_session_time(conversation)
+        texts = evidence_texts(conversation)
+        if args.offline:
+            timeline = list(locomo_timeline(sample))
+        else:
+            count = import_locomo_sample(user_id, sample)
+            print(f"Imported {count} turns for {user_id}")
+
+        for qa in sample["qa"]:
+            if qa["category"] != TEMPORAL_CATEGORY:
+                continue
+            question = qa["question"]
+            windowed.append(parse_time_range(question, now) is not None)
+
+            if args.offline:
+                contexts = {
+                    "full_dump": timed(offline_full_dump, timeline),
+                    "time_range": timed(offline_memory_context, timeline, question, now),
+                }
+            else:
+                contexts = {
+                    "full_dump": timed(load_user_memory, user_id),
+                    "time_range": timed(build_memory_context, user_id, question, now=now),
+                }
+            for name, (memory_text, ms) in contexts.items():
+                row = {
+                    "ms": ms,
+                    "chars": len(memory_text),
+                    "recall": evidence_recall(memory_text, qa.get("evidence", []), texts),
+                }
+                if client:
+                    reply = ask_model(client, memory_text, question)
+                    row["correct"] = answer_matches(reply, qa["answer"])
+                results[name].append(row)
+
+    print(f"\nAll temporal questions ({len(windowed)}):")
+    for name, rows in results.items():
+        summarize(name, rows)
+    print(f"\nQuestions naming a time window ({sum(windowed)}):")
+    for name, rows in results.items():
+        summarize(name, [row for row, has_window in zip(rows, windowed) if has_window])
+
+if __name__ == "__main__":
+    main()
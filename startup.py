@@ -0,0 +1,205 @@
+"""
+Startup helpers shared by the chat CLIs:
+- StartupTimer records how long each startup phase takes.
+- BackgroundTask / prepare_session warm up the database, ADK runner and model
+  client in the background while the prompt is shown. google.adk and
+  google.genai dominate startup time, so the CLIs only import them there.
+- relations_exist lets DDL run only when the schema is actually missing.
+- pooled_connection / retry_on_disconnect share connections from a psycopg2 pool.
+"""
+
+import asyncio
+import functools
+import os
+import threading
+import time
+from contextlib import contextmanager
+import psycopg2
+from psycopg2.pool import ThreadedConnectionPool
+
+# -----------------------------
+# Startup Timing
+# -----------------------------
+
+class StartupTimer:
+    """Collects (phase, milliseconds) pairs from the main and warm-up threads."""
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.phases = []
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def phase(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, (time.perf_counter() - start) * 1000)
+
+    def record(self, name, ms):
+        with self._lock:
+            self.phases.append((name, ms))
+
+    def mark(self, name):
+        """Record the time elapsed since the timer was created."""
+        self.record(name, (time.perf_counter() - self.started) * 1000)
+
+    def report(self):
+        with self._lock:
+            phases = list(self.phases)
+        lines = ["Startup time breakdown:"]
+        lines += [f"  {name:<28} {ms:8.1f} ms" for name, ms in phases]
+        return "\n".join(lines)
+
+def startup_report_enabled():
+    return os.getenv("STARTUP_REPORT", "").lower() in {"1", "true", "yes"}
+
+# -----------------------------
+# Background Warm-up
+# -----------------------------
+
+class BackgroundTask:
+    """
+    Run fn(*args) in a daemon thread. result() waits for it and re-raises its error.
+    Being a daemon, an unfinished task never delays exit or Ctrl-C.
+    """
+
+    def __init__(self, fn, *args):
+        self._result = None
+        self._error = None
+        self._thread = threading.Thread(target=self._run, args=(fn, args), daemon=True)
+        self._thread.start()
+
+    def _run(self, fn, args):
+        try:
+            self._result = fn(*args)
+        except Exception as e:
+            self._error = e
+
+    def result(self):
+        self._thread.join()
+        if self._error is not None:
+            raise self._error
+        return self._result
+
+def prepare_session(setup_agent, warm_database, app_name, user_id, session_id, timer):
+    """
+    Run warm_database(timer) alongside setup_agent(timer), then open the ADK session.
+    Returns (runner, session, result of warm_database).
+    """
+    database = BackgroundTask(warm_database, timer)
+    runner, session_service = setup_agent(timer)
+    database_result = database.result()
+    with timer.phase("open session"):
+        session = asyncio.run(open_session(session_service, app_name, user_id, session_id))
+    timer.mark("ready (since start)")
+    return runner, session, database_result
+
+async def open_session(session_service, app_name, user_id, session_id):
+    session = await session_service.get_session(
+        app_name=app_name,
+        user_id=user_id,
+        session_id=session_id,
+    )
+    if not session:
+        session = await session_service.create_session(
+            app_name=app_name,
+            user_id=user_id,
+            session_id=session_id,
+        )
+    return session
+
+def wait_for_warmup(warmup, timer):
+    """Join the warm-up on the first message; print and return None if it failed."""
+    try:
+        result = warmup.result()
+    except Exception as e:
+        print(f" Error while starting the chat session: {e}")
+        return None
+    if startup_report_enabled():
+        print(timer.report())
+    return result
+
+def make_gemini_model(model_name):
+    """
+    A Gemini model with its API client already created. Passing this instance
+    (not a model name) to Agent lets every turn reuse the client.
+    """
+    from google.adk.models import Gemini
+    model = Gemini(model=model_name)
+    # api_client is a cached property; touching it creates the client now
+    _ = model.api_client
+    return model
+
+# -----------------------------
+# Schema Check
+# -----------------------------
+
+def relations_exist(conn, *names):
+    """True if every named table/index exists (a catalog lookup, no DDL)."""
+    cur = conn.cursor()
+    cur.execute(
+        "SELECT bool_and(to_regclass(name) IS NOT NULL) FROM unnest(%s::text[]) AS name",
+        (list(names),),
+    )
+    exists = cur.fetchone()[0]
+    cur.close()
+    return bool(exists)
+
+# -----------------------------
+# Connection Pool
+# -----------------------------
+
+_pool = None
+_pool_lock = threading.Lock()
+
+def get_pool(dsn):
+    """Create the shared connection pool on first use."""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ThreadedConnectionPool(1, int(os.getenv("DB_POOL_MAX", "4")), dsn)
+        return _pool
+
+def _retire_pool(pool):
+    """
+    A dropped connection (server restart, idle timeout) means the other idle ones
+    are likely stale too: later checkouts get a fresh pool. Connections still in
+    use go back to the old pool, which closes them when it is garbage collected.
+    """
+    global _pool
+    with _pool_lock:
+        if _pool is pool:
+            _pool = None
+
+@contextmanager
+def pooled_connection(dsn):
+    """Borrow a connection from the pool; uncommitted work is rolled back on error."""
+    pool = get_pool(dsn)
+    conn = pool.getconn()
+    try:
+        yield conn
+    except Exception:
+        try:
+            conn.rollback()
+        except psycopg2.Error:
+            pass
+        if conn.closed:
+            _retire_pool(pool)
+        raise
+    finally:
+        pool.putconn(conn, close=bool(conn.closed))
+
+def retry_on_disconnect(fn):
+    """
+    Retry a database function once if its pooled connection turned out to be dead.
+    The retry runs on a fresh pool, so no health check is needed on every checkout.
+    """
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        try:
+            return fn(*args, **kwargs)
+        except (psycopg2.OperationalError, psycopg2.InterfaceError):
+            return fn(*args, **kwargs)
+    return wrapper
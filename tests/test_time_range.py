@@ -0,0 +1,115 @@
+from datetime import datetime
+
+import pytest
+
+from time_range import EARLIEST, TIME_RANGE_PADDING, describe_time_range, parse_time_range
+
+# A Friday
+NOW = datetime(2023, 10, 20, 14, 0)
+
+def window(text):
+    """The parsed range without the trailing padding."""
+    time_range = parse_time_range(text, NOW)
+    if time_range is None:
+        return None
+    start, end = time_range
+    return start, end - TIME_RANGE_PADDING
+
+def d(*args):
+    return datetime(*args)
+
+@pytest.mark.parametrize("text, expected", [
+    ("What happened on 2023-05-08?", (d(2023, 5, 8), d(2023, 5, 9))),
+    ("What did Caroline do on 8 May, 2023?", (d(2023, 5, 8), d(2023, 5, 9))),
+    ("What did Caroline do on May 8th, 2023?", (d(2023, 5, 8), d(2023, 5, 9))),
+    ("What did Caroline do on May 8?", (d(2023, 5, 8), d(2023, 5, 9))),
+    ("Where was Jon between August 11 and August 15 2023?", (d(2023, 8, 11), d(2023, 8, 16))),
+    ("What did Sam do in October 2023?", (d(2023, 10, 1), d(2023, 11, 1))),
+    ("What did Sam do between June and August 2023?", (d(2023, 6, 1), d(2023, 9, 1))),
+    ("Where was Jolene during the last week of August 2023?", (d(2023, 8, 25), d(2023, 9, 1))),
+    ("Where was Jolene during the last week of August?", (d(2023, 8, 25), d(2023, 9, 1))),
+    ("What did Evan do in the first week of June?", (d(2023, 6, 1), d(2023, 6, 8))),
+    ("Where was Tim in the second week of November?", (d(2022, 11, 8), d(2022, 11, 15))),
+    ("Where was Tim in the week before 16 November 2023?", (d(2023, 11, 9), d(2023, 11, 16))),
+    ("What did Tim do the week after May 8, 2023?", (d(2023, 5, 9), d(2023, 5, 16))),
+    ("What did Tim do the week of June 5, 2023?", (d(2023, 6, 5), d(2023, 6, 12))),
+    ("Where did Andrew go during the first weekend of August 2023?", (d(2023, 8, 5), d(2023, 8, 7))),
+    ("Where did Andrew go during the last weekend of June?", (d(2023, 6, 24), d(2023, 6, 26))),
+])
+def test_absolute(text, expected):
+    assert window(text) == expected
+
+@pytest.mark.parametrize("text, expected", [
+    ("What did I do today?", (d(2023, 10, 20), d(2023, 10, 21))),
+    ("What did I do yesterday?", (d(2023, 10, 19), d(2023, 10, 20))),
+    ("What did I do the day before yesterday?", (d(2023, 10, 18), d(2023, 10, 19))),
+    ("What did I eat 3 days ago?", (d(2023, 10, 17), d(2023, 10, 18))),
+    ("What happened two weeks ago?", (d(2023, 10, 3), d(2023, 10, 10))),
+    ("What happened a month ago?", (d(2023, 9, 1), d(2023, 10, 1))),
+    ("What happened a year ago?", (d(2022, 1, 1), d(2023, 1, 1))),
+    ("What did I do in the last 10 days?", (d(2023, 10, 10), d(2023, 10, 21))),
+    ("What did I do this week?", (d(2023, 10, 16), d(2023, 10, 23))),
+    ("What did I do last week?", (d(2023, 10, 9), d(2023, 10, 16))),
+    ("What did I do last weekend?", (d(2023, 10, 14), d(2023, 10, 16))),
+    ("What did I read last month?", (d(2023, 9, 1), d(2023, 10, 1))),
+    ("What did I read this year?", (d(2023, 1, 1), d(2024, 1, 1))),
+])
+def test_relative(text, expected):
+    assert window(text) == expected
+
+@pytest.mark.parametrize("text, expected", [
+    ("Where did Caroline go during the summer?", (d(2023, 6, 1), d(2023, 9, 1))),
+    ("Where did Caroline go in summer 2022?", (d(2022, 6, 1), d(2022, 9, 1))),
+    ("What did Nate do over the winter?", (d(2022, 12, 1), d(2023, 3, 1))),
+    ("What happened towards the end of summer 2023?", (d(2023, 6, 1), d(2023, 9, 1))),
+])
+def test_season(text, expected):
+    assert window(text) == expected
+
+@pytest.mark.parametrize("text, expected", [
+    ("What did I do last Saturday?", (d(2023, 10, 14), d(2023, 10, 15))),
+    ("What did I do on Friday?", (d(2023, 10, 13), d(2023, 10, 14))),
+    ("What did I do on Monday?", (d(2023, 10, 16), d(2023, 10, 17))),
+])
+def test_weekday(text, expected):
+    assert window(text) == expected
+
+@pytest.mark.parametrize("text, expected", [
+    ("When did Melanie go camping in June?", (d(2023, 6, 1), d(2023, 7, 1))),
+    ("What happened in November?", (d(2022, 11, 1), d(2022, 12, 1))),
+    ("What did Andrew do in 2022?", (d(2022, 1, 1), d(2023, 1, 1))),
+])
+def test_bare_month_and_year(text, expected):
+    assert window(text) == expected
+
+@pytest.mark.parametrize("text, expected", [
+    ("What has Tim read since June?", (d(2023, 6, 1), d(2023, 10, 21))),
+    ("What has Tim read since 2022?", (d(2022, 1, 1), d(2023, 10, 21))),
+    ("How many kids does Deborah have as of September 2023?", (EARLIEST, d(2023, 10, 1))),
+    ("How many kids does Deborah have as of November?", (EARLIEST, d(2022, 12, 1))),
+    ("How long since Andrew adopted a pet, as of November 2022?", (EARLIEST, d(2022, 12, 1))),
+])
+def test_open_ended(text, expected):
+    assert window(text) == expected
+
+@pytest.mark.parametrize("text", [
+    "When did Melanie paint a sunrise?",
+    "When did James try Cyberpunk 2077 game?",
+    "What may happen next?",
+    "Do you think 5 may be enough?",
+    "What happened on 31 February 2023?",
+])
+def test_no_window(text):
+    assert parse_time_range(text, NOW) is None
+
+def test_padding_extends_end():
+    start, end = parse_time_range("What did Sam do in October 2023?", NOW)
+    assert (start, end) == (d(2023, 10, 1), d(2023, 11, 1) + TIME_RANGE_PADDING)
+
+@pytest.mark.parametrize("text, expected", [
+    ("What did Sam do in October 2023?", "2023-10-01 to 2023-10-31"),
+    ("Who did Maria have dinner with on May 3, 2023?", "2023-05-03"),
+    ("How many pets did Andrew have, as of September 2023?", "up to 2023-09-30"),
+])
+def test_describe_excludes_padding(text, expected):
+    assert describe_time_range(*parse_time_range(text, NOW)) == expected
@@ -0,0 +1,284 @@
+"""
+Parse the time expression in a chat question ('in July 2023', 'last week',
+'since June', 'between August 11 and August 15 2023') into a (start, end)
+datetime range for memory lookups.
+"""
+
+import re
+from datetime import datetime, timedelta
+
+MONTHS = {
+    "january": 1, "february": 2, "march": 3, "april": 4, "may": 5, "june": 6,
+    "july": 7, "august": 8, "september": 9, "october": 10, "november": 11, "december": 12,
+    "jan": 1, "feb": 2, "mar": 3, "apr": 4, "jun": 6, "jul": 7, "aug": 8,
+    "sep": 9, "sept": 9, "oct": 10, "nov": 11, "dec": 12,
+}
+# Month names that are also common English words; without a year they only
+# count as a date when capitalized ('May 8', not 'they may 8...')
+AMBIGUOUS_MONTHS = {"may", "mar", "march"}
+SEASONS = {"spring": 3, "summer": 6, "fall": 9, "autumn": 9, "winter": 12}
+WEEK_ORDINALS = {"first": 0, "second": 1, "third": 2, "fourth": 3}
+WEEKDAYS = ["monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday"]
+NUMBER_WORDS = {
+    "a": 1, "an": 1, "one": 1, "two": 2, "three": 3, "four": 4, "five": 5,
+    "six": 6, "seven": 7, "eight": 8, "nine": 9, "ten": 10,
+}
+# People often recount an event weeks after it happened (chosen on locomo10.json)
+TIME_RANGE_PADDING = timedelta(days=30)
+# Start of an 'as of ...' range, which covers everything up to that point
+EARLIEST = datetime(1900, 1, 1)
+
+_MONTH = "|".join(sorted(MONTHS, key=len, reverse=True))
+_NUMBER = r"\d+|" + "|".join(NUMBER_WORDS)
+_ORDINAL = r"(?:st|nd|rd|th)?"
+
+def _search(pattern, text):
+    return re.search(pattern, text, flags=re.IGNORECASE)
+
+def _month_range(year, month, months=1):
+    start = datetime(year, month, 1)
+    month_index = year * 12 + month - 1 + months
+    return start, datetime(month_index // 12, month_index % 12 + 1, 1)
+
+def _months_back(now, n):
+    """(year, month) of the month n months before now."""
+    month_index = now.year * 12 + now.month - 1 - n
+    return month_index // 12, month_index % 12 + 1
+
+def _day_range(day):
+    start = datetime(day.year, day.month, day.day)
+    return start, start + timedelta(days=1)
+
+def _latest_year_for_month(month, now):
+    """Year of the most recent occurrence of a month (last year if it is still ahead)."""
+    return now.year if month <= now.month else now.year - 1
+
+def _to_number(word):
+    return int(word) if word.isdigit() else NUMBER_WORDS[word.lower()]
+
+def _absolute_days(text, now):
+    """
+    Every explicit day in the text (2023-05-08, 8 May 2023, August 11, ...).
+    A day without a year borrows the year written elsewhere in the text, so
+    'between August 11 and August 15 2023' yields both days in 2023.
+    """
+    year_match = _search(r"\b((?:19|20)\d{2})\b", text)
+    year_hint = int(year_match[1]) if year_match else None
+
+    days = []
+    taken = []
+    for m in re.finditer(r"\b(\d{4})-(\d{2})-(\d{2})\b", text):
+        days.append(datetime(int(m[1]), int(m[2]), int(m[3])))
+        taken.append(m.span())
+
+    patterns = [
+        (rf"\b(\d{{1,2}}){_ORDINAL}\s+(?:of\s+)?({_MONTH})\b(?:,?\s+(\d{{4}})\b)?", 2, 1),
+        (rf"\b({_MONTH})\s+(\d{{1,2}}){_ORDINAL}\b(?:,?\s+(\d{{4}})\b)?", 1, 2),
+    ]
+    for pattern, month_group, day_group in patterns:
+        for m in re.finditer(pattern, text, flags=re.IGNORECASE):
+            if any(start < m.end() and m.start() < end for start, end in taken):
+                continue
+            month_word = m[month_group]
+            if not m[3] and month_word.lower() in AMBIGUOUS_MONTHS and not month_word[0].isupper():
+                continue
+            month = MONTHS[month_word.lower()]
+            year = int(m[3]) if m[3] else (year_hint or _latest_year_for_month(month, now))
+            days.append(datetime(year, month, int(m[day_group])))
+            taken.append(m.span())
+    return days
+
+def _find_closed_range(text, now):
+    # "the week before 16 November 2023", "the week after May 8", "the week of June 5"
+    m = _search(r"\bweek (before|after|of)\s+", text)
+    if m:
+        days = _absolute_days(text[m.end():], now)
+        if days:
+            day, next_day = _day_range(days[0])
+            relation = m[1].lower()
+            if relation == "before":
+                return day - timedelta(days=7), day
+            if relation == "after":
+                return next_day, next_day + timedelta(days=7)
+            start = day - timedelta(days=day.weekday())
+            return start, start + timedelta(days=7)
+
+    # "the first weekend of August 2023", "the last weekend of June"
+    m = _search(rf"\b(first|last) weekend of ({_MONTH})\b(?:,?\s+(\d{{4}})\b)?", text)
+    if m:
+        month = MONTHS[m[2].lower()]
+        year = int(m[3]) if m[3] else _latest_year_for_month(month, now)
+        start, end = _month_range(year, month)
+        if m[1].lower() == "first":
+            saturday = start + timedelta(days=(5 - start.weekday()) % 7)
+        else:
+            last_day = end - timedelta(days=1)
+            saturday = last_day - timedelta(days=(last_day.weekday() - 5) % 7)
+        return saturday, saturday + timedelta(days=2)
+
+    # Explicit days; several of them ('between ... and ...') span from first to last
+    days = _absolute_days(text, now)
+    if days:
+        return _day_range(min(days))[0], _day_range(max(days))[1]
+
+    # "the last week of August 2023", "the second week of November"
+    m = _search(rf"\b({'|'.join(WEEK_ORDINALS)}|last) week of ({_MONTH})\b(?:,?\s+(\d{{4}})\b)?", text)
+    if m:
+        month = MONTHS[m[2].lower()]
+        year = int(m[3]) if m[3] else _latest_year_for_month(month, now)
+        start, end = _month_range(year, month)
+        if m[1].lower() == "last":
+            return end - timedelta(days=7), end
+        start += timedelta(weeks=WEEK_ORDINALS[m[1].lower()])
+        return start, start + timedelta(days=7)
+
+    # "July 2023", "between June and August 2023"
+    months = [
+        (int(m[2]), MONTHS[m[1].lower()])
+        for m in re.finditer(rf"\b({_MONTH}),?\s+(\d{{4}})\b", text, flags=re.IGNORECASE)
+    ]
+    if months:
+        m = _search(rf"\bbetween\s+({_MONTH})\s+and\s+({_MONTH}),?\s+(\d{{4}})\b", text)
+        if m:
+            months.append((int(m[3]), MONTHS[m[1].lower()]))
+        return _month_range(*min(months))[0], _month_range(*max(months))[1]
+
+    if _search(r"\bday before yesterday\b", text):
+        return _day_range(now - timedelta(days=2))
+    if _search(r"\byesterday\b", text):
+        return _day_range(now - timedelta(days=1))
+    if _search(r"\btoday\b", text):
+        return _day_range(now)
+
+    # "3 days ago", "two weeks ago", "a month ago", "a year ago"
+    m = _search(rf"\b({_NUMBER})\s+(day|week|month|year)s?\s+ago\b", text)
+    if m:
+        n = _to_number(m[1])
+        unit = m[2].lower()
+        if unit == "day":
+            return _day_range(now - timedelta(days=n))
+        if unit == "week":
+            start, _ = _day_range(now - timedelta(weeks=n))
+            return start - timedelta(days=3), start + timedelta(days=4)
+        if unit == "month":
+            return _month_range(*_months_back(now, n))
+        return datetime(now.year - n, 1, 1), datetime(now.year - n + 1, 1, 1)
+
+    # "last 10 days", "past two weeks"
+    m = _search(rf"\b(?:last|past)\s+({_NUMBER})\s+(day|week)s?\b", text)
+    if m:
+        days_back = _to_number(m[1]) * (1 if m[2].lower() == "day" else 7)
+        today, tomorrow = _day_range(now)
+        return today - timedelta(days=days_back), tomorrow
+
+    # "this week", "last weekend", "last month", "this year"
+    m = _search(r"\b(this|last|past)\s+(week|weekend|month|year)\b", text)
+    if m:
+        which, unit = m[1].lower(), m[2].lower()
+        today, _ = _day_range(now)
+        if unit in ("week", "weekend"):
+            start = today - timedelta(days=today.weekday())
+            if which != "this":
+                start -= timedelta(days=7)
+            if unit == "weekend":
+                start += timedelta(days=5)
+                return start, start + timedelta(days=2)
+            return start, start + timedelta(days=7)
+        if unit == "month":
+            return _month_range(*_months_back(now, 0 if which == "this" else 1))
+        year = now.year if which == "this" else now.year - 1
+        return datetime(year, 1, 1), datetime(year + 1, 1, 1)
+
+    # "last Saturday", "on Friday"
+    m = _search(rf"\b(?:last|on|this past)\s+({'|'.join(WEEKDAYS)})\b", text)
+    if m:
+        days_back = (now.weekday() - WEEKDAYS.index(m[1].lower())) % 7 or 7
+        return _day_range(now - timedelta(days=days_back))
+
+    # "summer 2022", "the end of summer of 2023", "during the summer"
+    m = _search(rf"\b({'|'.join(SEASONS)}),?\s+(?:of\s+)?(\d{{4}})\b", text)
+    if m:
+        return _month_range(int(m[2]), SEASONS[m[1].lower()], months=3)
+    m = _search(rf"\b(?:in|during|over|this|last)\s+(?:the\s+)?({'|'.join(SEASONS)})\b", text)
+    if m:
+        month = SEASONS[m[1].lower()]
+        return _month_range(_latest_year_for_month(month, now), month, months=3)
+
+    # "in June" (needs a preposition so 'may'/'march' stay verbs)
+    m = _search(rf"\b(?:in|during|of|early|late|mid)\s+({_MONTH})\b", text)
+    if m:
+        month = MONTHS[m[1].lower()]
+        return _month_range(_latest_year_for_month(month, now), month)
+
+    # "in 2022"; later years are names ('Cyberpunk 2077'), not dates
+    m = _search(r"\b((?:19|20)\d{2})\b", text)
+    if m and int(m[1]) <= now.year:
+        year = int(m[1])
+        return datetime(year, 1, 1), datetime(year + 1, 1, 1)
+
+    return None
+
+def _find_time_range(text, now):
+    # Open-ended ranges: "since June" runs to now, "as of September 2023" covers
+    # everything up to the end of September 2023
+    # Only when the time comes right after the keyword ('since June', not 'since he moved')
+    m = _search(rf"\b(since|as of)\s+(?=(?:the\s+)?(?:\d|(?:{_MONTH}|last|this|past|early|mid|late)\b))", text)
+    if m:
+        rest = text[m.end():]
+        bare_month = _search(rf"^({_MONTH})\b(?!,?\s+\d)", rest)
+        if bare_month:
+            month = MONTHS[bare_month[1].lower()]
+            inner = _month_range(_latest_year_for_month(month, now), month)
+        else:
+            inner = _find_closed_range(rest, now)
+        if inner:
+            if m[1].lower() == "since":
+                return inner[0], _day_range(now)[1]
+            return EARLIEST, inner[1]
+
+    return _find_closed_range(text, now)
+
+def parse_time_range(text, now=None):
+    """
+    Parse the time expression in a question into a (start, end) datetime range.
+    Returns None when the question does not name a time window.
+    """
+    now = now or datetime.now()
+    try:
+        time_range = _find_time_range(text, now)
+    except ValueError:
+        # Impossible dates such as '31 February 2023'
+        return None
+    if time_range is None:
+        return None
+    start, end = time_range
+    return start, end + TIME_RANGE_PADDING
+
+def describe_time_range(start, end):
+    """Human-readable form of a range from parse_time_range, e.g. '2023-10-01 to 2023-10-31'."""
+    last_day = (end - TIME_RANGE_PADDING - timedelta(days=1)).strftime("%Y-%m-%d")
+    if start == EARLIEST:
+        return f"up to {last_day}"
+    first_day = start.strftime("%Y-%m-%d")
+    if first_day == last_day:
+        return f"{first_day}"
+    return f"{first_day} to {last_day}"
+
+def parse_session_date_time(value):
+    """Parse a LoCoMo session timestamp like '1:56 pm on 8 May, 2023'."""
+    return datetime.strptime(value, "%I:%M %p on %d %B, %Y")
+
+def locomo_timeline(sample):
+    """
+    (session_id, speaker, text, created_at) for every turn of a locomo10.json
+    conversation, stamped with its original session_N_date_time.
+    """
+    conversation = sample["conversation"]
+    n = 1
+    while f"session_{n}" in conversation:
+        session_start = parse_session_date_time(conversation[f"session_{n}_date_time"])
+        session_id = f"{sample['sample_id']}_session_{n}"
+        for i, turn in enumerate(conversation[f"session_{n}"]):
+            # One second apart keeps turns ordered within a session
+            yield session_id, turn["speaker"], turn["text"], session_start + timedelta(seconds=i)
+        n += 1